@@ -1,8 +1,8 @@
 import os
-from calendar import monthrange
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
@@ -22,18 +22,14 @@ MONTH_ABBR   = {10: "Oct", 11: "Nov", 12: "Dec", 1: "Jan", 2: "Feb", 3: "Mar", 4
 MONTH_FULL   = {1: "January", 2: "February", 3: "March", 4: "April", 5: "May",
                 6: "June", 7: "July", 8: "August", 9: "September",
                 10: "October", 11: "November", 12: "December"}
+# Leap-year lengths so Feb 29 games can be looked up.
+DAYS_IN_MONTH = {1: 31, 2: 29, 3: 31, 4: 30, 5: 31, 6: 30,
+                 7: 31, 8: 31, 9: 30, 10: 31, 11: 30, 12: 31}
 
-TZ = ZoneInfo("America/New_York")
+WIN_OUTCOMES  = ("Win", "Win OT", "Win SO")
+LOSS_OUTCOMES = ("Loss", "Loss OT", "Loss SO")
 
-# ─── Page Config ─────────────────────────────────────────────────────────────
-st.set_page_config(
-    page_title="Bruins by the Numbers",
-    page_icon="🏒",
-    layout="wide",
-    initial_sidebar_state="expanded",
-)
-
-st.markdown(f"""
+PAGE_CSS = f"""
 <style>
 .stApp {{ background-color: {WHITE}; color: {BLACK}; }}
 [data-testid="stMetricValue"] {{ color: {BLACK} !important; }}
@@ -50,13 +46,32 @@ div[data-testid="metric-container"] {{
     font-weight: 600;
 }}
 </style>
-""", unsafe_allow_html=True)
+"""
+
+TZ = ZoneInfo("America/New_York")
+
+# Prefer the typed Parquet copy written by scrape_data.py; fall back to the CSV.
+DATA_PATH = ("bruins_game_history.parquet" if os.path.exists("bruins_game_history.parquet")
+             else "bruins_game_history.csv")
+
+# ─── Page Config ─────────────────────────────────────────────────────────────
+st.set_page_config(
+    page_title="Bruins by the Numbers",
+    page_icon="🏒",
+    layout="wide",
+    initial_sidebar_state="expanded",
+)
+
+st.markdown(PAGE_CSS, unsafe_allow_html=True)
 
 
 # ─── Data Loading & Cleaning ──────────────────────────────────────────────────
-@st.cache_data
-def load_data() -> pd.DataFrame:
-    df = pd.read_csv("bruins_game_history.csv")
+@st.cache_data(show_spinner=False)
+def load_data(path: str) -> pd.DataFrame:
+    if path.endswith(".parquet"):
+        df = pd.read_parquet(path, engine="pyarrow")
+    else:
+        df = pd.read_csv(path)
 
     # Normalise column names — handle both the old Hockey-Reference CSV export
     # (which has "Unnamed: N" headers) and the new scraper format.
@@ -74,7 +89,7 @@ def load_data() -> pd.DataFrame:
     if "Outcome" in df.columns and "Result" not in df.columns:
         df = df.rename(columns={"Outcome": "Result"})
 
-    # Date
+    # Date (already datetime64 when loaded from Parquet, so this is a no-op there)
     df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
     df = df.dropna(subset=["Date"])
 
@@ -83,32 +98,37 @@ def load_data() -> pd.DataFrame:
         df["Location"] = "Home"
     df["Location"] = df["Location"].fillna("Home").replace({"@": "Away", "": "Home"})
 
-    # Numeric columns
-    for col in ["GF", "GA", "W", "L", "T", "OL", "GP"]:
+    # Numeric columns — per-game goals and season-to-date counts all fit in
+    # one or two bytes.
+    for col, dtype in [("GF", "Int16"), ("GA", "Int16"), ("GP", "Int16"),
+                       ("W", "Int8"), ("L", "Int8"), ("T", "Int8"), ("OL", "Int8")]:
         if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce").astype("Int64")
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype(dtype)
 
     # Build standardised Outcome from Result + optional OT_SO modifier
-    result = df["Result"].fillna("").astype(str) if "Result" in df.columns else pd.Series("", index=df.index)
-    ot_so  = df["OT_SO"].fillna("").astype(str) if "OT_SO" in df.columns else pd.Series("", index=df.index)
-    raw    = result + ot_so
-
-    def _std(o: str) -> str:
-        o = o.strip()
-        if "W" in o:
-            if "OT" in o: return "Win OT"
-            if "SO" in o: return "Win SO"
-            return "Win"
-        if "L" in o:
-            if "OT" in o: return "Loss OT"
-            if "SO" in o: return "Loss SO"
-            return "Loss"
-        if "T" in o:
-            return "Tie"
-        return "Unknown"
-
-    df["Outcome"]   = raw.apply(_std)
-    df["Win"]       = df["Outcome"].apply(lambda x: 1 if "Win" in x else 0)
+    # Arrow-backed strings so the substring checks below run in pyarrow's
+    # compute kernels rather than per-object Python calls.
+    def _text(col: str) -> pd.Series:
+        if col not in df.columns:
+            return pd.Series("", index=df.index, dtype="string[pyarrow]")
+        return df[col].fillna("").astype("string[pyarrow]")
+
+    raw    = _text("Result") + _text("OT_SO")
+
+    # np.select takes the first match, so W beats L beats T and an OT/SO
+    # marker refines a win or loss.
+    has = {k: raw.str.contains(k, regex=False) for k in ("W", "L", "T", "OT", "SO")}
+    df["Outcome"] = pd.Categorical(np.select(
+        [has["W"] & has["OT"], has["W"] & has["SO"], has["W"],
+         has["L"] & has["OT"], has["L"] & has["SO"], has["L"],
+         has["T"]],
+        ["Win OT", "Win SO", "Win", "Loss OT", "Loss SO", "Loss", "Tie"],
+        default="Unknown",
+    ))
+    # Outcome is categorical, so these compare category codes, not strings.
+    df["Win"]       = df["Outcome"].isin(WIN_OUTCOMES).to_numpy().astype(np.int8, copy=False)
+    df["IsLoss"]    = df["Outcome"].isin(LOSS_OUTCOMES).to_numpy().astype(np.int8, copy=False)
+    df["IsTie"]     = (df["Outcome"] == "Tie").astype(np.int8)
     df["GoalDiff"]  = (df["GF"] - df["GA"]).astype(float)
 
     # Temporal features
@@ -121,10 +141,25 @@ def load_data() -> pd.DataFrame:
     if "Season" not in df.columns:
         df["Season"] = df["Date"].dt.year.where(df["Date"].dt.month < 9,
                                                 df["Date"].dt.year + 1)
-    df["Season"] = pd.to_numeric(df["Season"], errors="coerce").astype("Int64")
+    df["Season"] = pd.to_numeric(df["Season"], errors="coerce").astype("Int16")
+
+    # Keep rows in Season (and so Date) order: any season range is one
+    # contiguous block (see season_slice), and rows taken by ascending
+    # position come out oldest first, so newest-first is just a reversal.
+    df = df.dropna(subset=["Season"]).sort_values(["Season", "Date"], kind="stable")
+
+    # Low-cardinality text columns: store as category codes so filters and
+    # groupbys compare small ints instead of Python strings.
+    for col in ["Opponent", "Location", "MM_DD"]:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    df["DayOfWeek"] = pd.Categorical(df["DayOfWeek"], DAYS_ORDER, ordered=True)
+    if "Streak" in df.columns:
+        df["Streak"] = df["Streak"].astype("string[pyarrow]")
 
     keep = ["Season", "GP", "Date", "Month", "Day", "MM_DD", "DayOfWeek",
             "Location", "Opponent", "GF", "GA", "GoalDiff", "Outcome", "Win",
+            "IsLoss", "IsTie",
             "W", "L", "T", "OL", "Streak"]
     return df[[c for c in keep if c in df.columns]].reset_index(drop=True)
 
@@ -140,13 +175,36 @@ def fmt_record(wins: int, losses: int, ties: int = 0) -> str:
     return s
 
 def get_record(d: pd.DataFrame) -> dict:
+    # One histogram over the Outcome codes instead of a pass per tally.
+    counts = d["Outcome"].value_counts()
     total  = len(d)
-    wins   = int(d["Win"].sum())
-    losses = int(d["Outcome"].str.contains("Loss").sum())
-    ties   = int((d["Outcome"] == "Tie").sum())
+    wins   = int(counts.reindex(WIN_OUTCOMES, fill_value=0).sum())
+    losses = int(counts.reindex(LOSS_OUTCOMES, fill_value=0).sum())
+    ties   = int(counts.get("Tie", 0))
     return {"total": total, "wins": wins, "losses": losses,
             "ties": ties, "win_pct": win_pct(wins, total)}
 
+def record_metrics(r: dict, record_label: str = "Record", games_label: str = "Games",
+                   stacked: bool = False) -> None:
+    # Record / Win Rate / Games straight from a get_record() dict, either
+    # side by side or stacked in the current container.
+    slots = [st] * 3 if stacked else st.columns(3)
+    slots[0].metric(record_label, fmt_record(r["wins"], r["losses"], r["ties"]))
+    slots[1].metric("Win Rate", f"{r['win_pct']}%")
+    slots[2].metric(games_label, r["total"])
+
+def season_slice(d: pd.DataFrame, start: int, end: int) -> pd.DataFrame:
+    # load_data() sorts by Season, so binary-search the block bounds instead
+    # of masking every row.
+    lo = d["Season"].searchsorted(start, side="left")
+    hi = d["Season"].searchsorted(end, side="right")
+    return d.iloc[lo:hi]
+
+NO_ROWS = np.array([], dtype=np.intp)
+
+def take_rows(d: pd.DataFrame, index: dict, key) -> pd.DataFrame:
+    return d.take(index.get(key, NO_ROWS))
+
 def _bar_layout(title: str, height: int = 360, **kwargs) -> dict:
     defaults = dict(title=title, plot_bgcolor=WHITE, paper_bgcolor=WHITE,
                     font_color=BLACK, height=height,
@@ -156,7 +214,7 @@ def _bar_layout(title: str, height: int = 360, **kwargs) -> dict:
 
 
 # ─── Load Data ───────────────────────────────────────────────────────────────
-df_all   = load_data()
+df_all   = load_data(DATA_PATH)
 seasons  = sorted(df_all["Season"].dropna().unique().tolist())
 
 # ─── Sidebar ─────────────────────────────────────────────────────────────────
@@ -168,36 +226,96 @@ st.sidebar.subheader("Season Range")
 start_s = st.sidebar.selectbox("From", seasons, index=0)
 end_s   = st.sidebar.selectbox("To",   seasons, index=len(seasons) - 1)
 
-df = df_all[(df_all["Season"] >= start_s) & (df_all["Season"] <= end_s)].reset_index(drop=True)
+df = season_slice(df_all, start_s, end_s)
 
 st.sidebar.markdown("---")
-csv_mtime = os.path.getmtime("bruins_game_history.csv")
-csv_date  = datetime.fromtimestamp(csv_mtime).strftime("%b %d, %Y")
+data_mtime = os.path.getmtime(DATA_PATH)
+data_date  = datetime.fromtimestamp(data_mtime, TZ).strftime("%b %d, %Y")
 st.sidebar.markdown(
     f"<p style='font-size:0.78rem; color:#999;'>"
     f"{len(df_all):,} games &nbsp;·&nbsp; {seasons[0]}–{seasons[-1]}<br>"
-    f"Dataset updated: {csv_date}<br>"
+    f"Dataset updated: {data_date}<br>"
     f"<code>python scrape_data.py</code> to refresh"
     f"</p>",
     unsafe_allow_html=True,
 )
 
-# ─── Pre-compute Opponent Summary (used in multiple tabs) ─────────────────────
+# ─── Pre-compute Lookup Indexes (date / weekday / opponent → row positions) ──
+@st.cache_data(show_spinner=False)
+def build_indexes(start: int, end: int) -> dict[str, dict]:
+    d = season_slice(load_data(DATA_PATH), start, end)
+    return {col: d.groupby(col, observed=True).indices
+            for col in ["MM_DD", "DayOfWeek", "Opponent"]}
+
+idx = build_indexes(start_s, end_s)
+
+# ─── Pre-compute Summaries (used in multiple tabs) ───────────────────────────
 def build_opp_stats(d: pd.DataFrame) -> pd.DataFrame:
     stats = (
-        d.groupby("Opponent")
-        .apply(lambda g: pd.Series({
-            "games":  len(g),
-            "wins":   int(g["Win"].sum()),
-            "losses": int(g["Outcome"].str.contains("Loss").sum()),
-            "ties":   int((g["Outcome"] == "Tie").sum()),
-        }), include_groups=False)
+        d.groupby("Opponent", observed=True)
+        .agg(games=("Win", "size"), wins=("Win", "sum"),
+             losses=("IsLoss", "sum"), ties=("IsTie", "sum"))
         .reset_index()
     )
     stats["WinPct"] = (stats["wins"] / stats["games"] * 100).round(1)
     return stats.sort_values("WinPct", ascending=False).reset_index(drop=True)
 
-opp_stats = build_opp_stats(df)
+def build_dow_stats(d: pd.DataFrame) -> pd.DataFrame:
+    # Only seven buckets, so count straight off the DayOfWeek codes rather
+    # than paying for groupby setup on every (often tiny) opponent slice.
+    codes = d["DayOfWeek"].cat.codes.to_numpy()
+    games = np.bincount(codes, minlength=len(DAYS_ORDER))
+    wins  = np.bincount(codes, weights=d["Win"].to_numpy(), minlength=len(DAYS_ORDER))
+    stats = pd.DataFrame({
+        "DayOfWeek": pd.Categorical(DAYS_ORDER, DAYS_ORDER, ordered=True),
+        "wins":      wins.astype(np.int64),
+        "games":     games,
+    })
+    stats = stats[stats["games"] > 0].reset_index(drop=True)
+    stats["WinPct"] = (stats["wins"] / stats["games"] * 100).round(1)
+    return stats
+
+# Cached on plain scalars so Streamlit never has to hash a DataFrame; widget
+# changes that don't touch the season range or opponent reuse the result.
+@st.cache_data(show_spinner=False)
+def opp_stats_for(start: int, end: int) -> pd.DataFrame:
+    return build_opp_stats(season_slice(load_data(DATA_PATH), start, end))
+
+@st.cache_data(show_spinner=False)
+def dow_stats_for(start: int, end: int, opponent: str | None = None) -> pd.DataFrame:
+    d = season_slice(load_data(DATA_PATH), start, end)
+    if opponent is not None:
+        d = d[d["Opponent"] == opponent]
+    return build_dow_stats(d)
+
+opp_stats = opp_stats_for(start_s, end_s)
+opponents = sorted(opp_stats["Opponent"].tolist())
+
+# The figure only depends on the season range; cache_resource hands back the
+# same object rather than rebuilding and re-validating it every rerun.
+@st.cache_resource(show_spinner=False)
+def build_opp_fig(start: int, end: int) -> go.Figure:
+    stats = opp_stats_for(start, end)
+    fig = go.Figure(go.Bar(
+        x=stats["Opponent"],
+        y=stats["WinPct"],
+        marker_color=[GOLD if w >= 50 else RED for w in stats["WinPct"]],
+        marker_line_color=BLACK, marker_line_width=0.5,
+        customdata=stats[["wins", "losses", "games"]].values,
+        hovertemplate=(
+            "%{x}<br>Win Rate: %{y:.1f}%<br>"
+            "W-L: %{customdata[0]}-%{customdata[1]} (%{customdata[2]} GP)"
+            "<extra></extra>"
+        ),
+    ))
+    fig.add_hline(y=50, line_dash="dash", line_color="#999", line_width=1)
+    fig.update_layout(
+        **_bar_layout("Win Rate vs Every Opponent  (gold = winning record, red = losing)",
+                      height=430, xaxis_tickangle=45,
+                      yaxis=dict(range=[0, 100]), yaxis_title="Win %",
+                      margin=dict(t=50, b=130, l=50, r=20))
+    )
+    return fig
 
 # ─── Title ───────────────────────────────────────────────────────────────────
 st.markdown(
@@ -218,8 +336,7 @@ tab_today, tab_explore, tab_rivalries, tab_trends, tab_deep = st.tabs(
 # TODAY
 # ═══════════════════════════════════════════════════════════════════════════════
 with tab_today:
-    now      = datetime.now(TZ)
-    today    = now.date()
+    today    = datetime.now(TZ).date()
     mm_dd    = today.strftime("%m-%d")
     day_name = today.strftime("%A")
 
@@ -235,19 +352,16 @@ with tab_today:
 
     # --- record on this calendar date ---
     with col_date:
-        date_games = df[df["MM_DD"] == mm_dd]
+        date_games = take_rows(df, idx["MM_DD"], mm_dd)
         st.subheader(f"On {today.strftime('%B %d')} historically")
         if date_games.empty:
             st.info("No games on this date in the selected range.")
         else:
             r = get_record(date_games)
-            m1, m2, m3 = st.columns(3)
-            m1.metric("Record", fmt_record(r["wins"], r["losses"], r["ties"]))
-            m2.metric("Win Rate", f"{r['win_pct']}%")
-            m3.metric("Games", r["total"])
+            record_metrics(r)
 
             with st.expander(f"All {r['total']} games on {today.strftime('%B %d')}"):
-                show = date_games.sort_values("Date", ascending=False)[
+                show = date_games.iloc[::-1][
                     ["Date", "Season", "Location", "Opponent", "GF", "GA", "Outcome"]
                 ].copy()
                 show["Date"] = show["Date"].dt.strftime("%Y-%m-%d")
@@ -255,27 +369,16 @@ with tab_today:
 
     # --- record on this day of week ---
     with col_dow:
-        dow_games = df[df["DayOfWeek"] == day_name]
+        dow_games = take_rows(df, idx["DayOfWeek"], day_name)
         st.subheader(f"On {day_name}s historically")
         if dow_games.empty:
             st.info("No games on this day in the selected range.")
         else:
             r = get_record(dow_games)
-            m1, m2, m3 = st.columns(3)
-            m1.metric("Record", fmt_record(r["wins"], r["losses"], r["ties"]))
-            m2.metric("Win Rate", f"{r['win_pct']}%")
-            m3.metric("Games", r["total"])
+            record_metrics(r)
 
             # Mini bar chart — highlight today's day
-            dow_agg = (
-                df.groupby("DayOfWeek")["Win"]
-                .agg(["sum", "count"])
-                .rename(columns={"sum": "wins", "count": "games"})
-                .reset_index()
-            )
-            dow_agg["WinPct"] = (dow_agg["wins"] / dow_agg["games"] * 100).round(1)
-            dow_agg["DayOfWeek"] = pd.Categorical(dow_agg["DayOfWeek"], DAYS_ORDER, ordered=True)
-            dow_agg = dow_agg.sort_values("DayOfWeek")
+            dow_agg = dow_stats_for(start_s, end_s)
 
             fig = go.Figure(go.Bar(
                 x=dow_agg["DayOfWeek"],
@@ -303,30 +406,30 @@ with tab_explore:
         if by == "Calendar Date":
             months = list(range(1, 13))
             sel_m = st.selectbox("Month", months,
-                                 format_func=lambda x: datetime(2020, x, 1).strftime("%B"),
+                                 format_func=MONTH_FULL.get,
                                  index=9)
-            sel_d = st.selectbox("Day", list(range(1, monthrange(2020, sel_m)[1] + 1)))
+            sel_d = st.selectbox("Day", list(range(1, DAYS_IN_MONTH[sel_m] + 1)))
             lookup_mm_dd = f"{sel_m:02d}-{sel_d:02d}"
-            lookup_label = datetime(2020, sel_m, sel_d).strftime("%B %d")
+            lookup_label = f"{MONTH_FULL[sel_m]} {sel_d:02d}"
         else:
             sel_dow = st.selectbox("Day", DAYS_ORDER, index=5)
 
-        opp_opts = ["All opponents"] + sorted(df["Opponent"].dropna().unique())
+        opp_opts = ["All opponents"] + opponents
         sel_opp  = st.selectbox("vs.", opp_opts)
         opp_f    = None if sel_opp == "All opponents" else sel_opp
 
     with right:
         if by == "Calendar Date":
-            mask  = df["MM_DD"] == lookup_mm_dd
+            rows  = idx["MM_DD"].get(lookup_mm_dd, NO_ROWS)
             label = f"Record on {lookup_label}"
         else:
-            mask  = df["DayOfWeek"] == sel_dow
+            rows  = idx["DayOfWeek"].get(sel_dow, NO_ROWS)
             label = f"Record on {sel_dow}s"
         if opp_f:
-            mask  &= df["Opponent"] == opp_f
+            rows  = np.intersect1d(rows, idx["Opponent"].get(opp_f, NO_ROWS), assume_unique=True)
             label += f" vs {opp_f}"
 
-        games = df[mask].sort_values("Date", ascending=False)
+        games = df.take(rows).iloc[::-1]
         st.subheader(label)
 
         if games.empty:
@@ -345,6 +448,7 @@ with tab_explore:
 
             # Outcome pie
             oc = games["Outcome"].value_counts()
+            oc = oc[oc > 0]
             fig_pie = go.Figure(go.Pie(
                 labels=oc.index, values=oc.values, hole=0.42,
                 marker_colors=[GOLD if "Win" in l else (RED if "Loss" in l else "#888")
@@ -370,54 +474,24 @@ with tab_rivalries:
     st.header("Head-to-Head Records")
 
     # Full opponent bar chart
-    fig_all = go.Figure(go.Bar(
-        x=opp_stats["Opponent"],
-        y=opp_stats["WinPct"],
-        marker_color=[GOLD if w >= 50 else RED for w in opp_stats["WinPct"]],
-        marker_line_color=BLACK, marker_line_width=0.5,
-        customdata=opp_stats[["wins", "losses", "games"]].values,
-        hovertemplate=(
-            "%{x}<br>Win Rate: %{y:.1f}%<br>"
-            "W-L: %{customdata[0]}-%{customdata[1]} (%{customdata[2]} GP)"
-            "<extra></extra>"
-        ),
-    ))
-    fig_all.add_hline(y=50, line_dash="dash", line_color="#999", line_width=1)
-    fig_all.update_layout(
-        **_bar_layout("Win Rate vs Every Opponent  (gold = winning record, red = losing)",
-                      height=430, xaxis_tickangle=45,
-                      yaxis=dict(range=[0, 100]), yaxis_title="Win %",
-                      margin=dict(t=50, b=130, l=50, r=20))
-    )
-    st.plotly_chart(fig_all, use_container_width=True)
+    st.plotly_chart(build_opp_fig(start_s, end_s), use_container_width=True)
 
     st.markdown("---")
     st.subheader("Opponent Deep Dive")
 
-    sel_rival   = st.selectbox("Select opponent", sorted(df["Opponent"].dropna().unique()))
-    rival_games = df[df["Opponent"] == sel_rival].sort_values("Date", ascending=False)
+    sel_rival   = st.selectbox("Select opponent", opponents)
+    rival_games = take_rows(df, idx["Opponent"], sel_rival).iloc[::-1]
 
     if not rival_games.empty:
         home_g = rival_games[rival_games["Location"] == "Home"]
         away_g = rival_games[rival_games["Location"] == "Away"]
         ov, hr, ar = get_record(rival_games), get_record(home_g), get_record(away_g)
 
-        c1, c2, c3 = st.columns(3)
-        with c1:
-            st.markdown("**Overall**")
-            st.metric("Record",  fmt_record(ov["wins"], ov["losses"], ov["ties"]))
-            st.metric("Win Rate", f"{ov['win_pct']}%")
-            st.metric("Games", ov["total"])
-        with c2:
-            st.markdown("**At Home**")
-            st.metric("Record",  fmt_record(hr["wins"], hr["losses"], hr["ties"]))
-            st.metric("Win Rate", f"{hr['win_pct']}%")
-            st.metric("Games", hr["total"])
-        with c3:
-            st.markdown("**On the Road**")
-            st.metric("Record",  fmt_record(ar["wins"], ar["losses"], ar["ties"]))
-            st.metric("Win Rate", f"{ar['win_pct']}%")
-            st.metric("Games", ar["total"])
+        for col, heading, rec in zip(st.columns(3), ["Overall", "At Home", "On the Road"],
+                                     [ov, hr, ar]):
+            with col:
+                st.markdown(f"**{heading}**")
+                record_metrics(rec, stacked=True)
 
         # Scoring
         st.markdown("---")
@@ -427,15 +501,7 @@ with tab_rivalries:
         sc3.metric("Avg Goal Diff",       f"{rival_games['GoalDiff'].mean():+.2f}")
 
         # Win rate by day of week vs this opponent
-        dow_r = (
-            rival_games.groupby("DayOfWeek")["Win"]
-            .agg(["sum", "count"])
-            .rename(columns={"sum": "wins", "count": "games"})
-            .reset_index()
-        )
-        dow_r["WinPct"] = (dow_r["wins"] / dow_r["games"] * 100).round(1)
-        dow_r["DayOfWeek"] = pd.Categorical(dow_r["DayOfWeek"], DAYS_ORDER, ordered=True)
-        dow_r = dow_r.sort_values("DayOfWeek")
+        dow_r = dow_stats_for(start_s, end_s, sel_rival)
 
         fig_dow = go.Figure(go.Bar(
             x=dow_r["DayOfWeek"], y=dow_r["WinPct"],
@@ -699,23 +765,20 @@ with tab_deep:
     bd1, bd2 = st.columns([1, 2])
     with bd1:
         bd_month = st.selectbox("Month", list(range(1, 13)),
-                                format_func=lambda x: datetime(2020, x, 1).strftime("%B"),
+                                format_func=MONTH_FULL.get,
                                 key="bd_m")
-        bd_day   = st.selectbox("Day", list(range(1, monthrange(2020, bd_month)[1] + 1)),
+        bd_day   = st.selectbox("Day", list(range(1, DAYS_IN_MONTH[bd_month] + 1)),
                                 key="bd_d")
         bd_mm_dd = f"{bd_month:02d}-{bd_day:02d}"
-        bd_label = datetime(2020, bd_month, bd_day).strftime("%B %d")
+        bd_label = f"{MONTH_FULL[bd_month]} {bd_day:02d}"
 
     with bd2:
-        bd_games = df[df["MM_DD"] == bd_mm_dd]
+        bd_games = take_rows(df, idx["MM_DD"], bd_mm_dd)
         if bd_games.empty:
             st.info(f"No Bruins games ever played on {bd_label} in the selected range.")
         else:
             br = get_record(bd_games)
-            bm1, bm2, bm3 = st.columns(3)
-            bm1.metric("Birthday Record", fmt_record(br["wins"], br["losses"], br["ties"]))
-            bm2.metric("Win Rate", f"{br['win_pct']}%")
-            bm3.metric("Games Played", br["total"])
+            record_metrics(br, record_label="Birthday Record", games_label="Games Played")
 
             if br["win_pct"] >= 70:
                 st.success(f"The Bruins absolutely dominate on {bd_label}. Lucky you.")
@@ -726,7 +789,7 @@ with tab_deep:
             else:
                 st.warning(f"The Bruins have a losing record on your birthday. Not great.")
 
-            bd_show = bd_games.sort_values("Date", ascending=False)[
+            bd_show = bd_games.iloc[::-1][
                 ["Date", "Season", "Opponent", "Location", "GF", "GA", "Outcome"]
             ].copy()
             bd_show["Date"] = bd_show["Date"].dt.strftime("%Y-%m-%d")
@@ -1,11 +1,13 @@
 #!/usr/bin/env python3
 """
 Scrape Boston Bruins regular-season game history from Hockey-Reference.com
-and save to bruins_game_history.csv.
+and save to bruins_game_history.csv (plus a typed Parquet copy that the app
+loads in preference to the CSV).
 
 Usage:
   python scrape_data.py              # All seasons 2000–present
   python scrape_data.py 2024 2025    # Only specific end-years
+  python scrape_data.py --parquet    # Rebuild the Parquet copy from the existing CSV
 """
 
 import sys
@@ -24,6 +26,10 @@ HEADERS = {
     "Accept-Language": "en-US,en;q=0.9",
 }
 
+CSV_OUT     = "bruins_game_history.csv"
+PARQUET_OUT = "bruins_game_history.parquet"
+NUMERIC_COLS = ["Season", "GP", "GF", "GA", "W", "L", "T", "OL"]
+
 # Maps Hockey-Reference data-stat attribute names to our column names.
 STAT_RENAME = {
     "ranker":        "GP",
@@ -119,9 +125,25 @@ def scrape_season(year: int) -> pd.DataFrame | None:
     return df
 
 
+def write_parquet(df: pd.DataFrame, out: str = PARQUET_OUT) -> None:
+    """Save a copy of the raw game log with dates and numbers already typed,
+    so the app can skip text parsing on load."""
+    df = df.copy()
+    df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
+    for col in NUMERIC_COLS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype("Int64")
+    df.to_parquet(out, index=False)
+    print(f"Saved {len(df):,} games to {out}")
+
+
 def main() -> None:
     current_year = 2025  # end-year of the current/most-recent season
 
+    if sys.argv[1:] == ["--parquet"]:
+        write_parquet(pd.read_csv(CSV_OUT))
+        return
+
     if len(sys.argv) > 1:
         years = [int(y) for y in sys.argv[1:]]
     else:
@@ -147,10 +169,10 @@ def main() -> None:
         sys.exit(1)
 
     combined = pd.concat(frames, ignore_index=True)
-    out = "bruins_game_history.csv"
-    combined.to_csv(out, index=False)
+    combined.to_csv(CSV_OUT, index=False)
 
-    print(f"\nSaved {len(combined):,} games to {out}")
+    print(f"\nSaved {len(combined):,} games to {CSV_OUT}")
+    write_parquet(combined)
     print(f"Seasons covered: {combined['Season'].min()}–{combined['Season'].max()}")
 
 